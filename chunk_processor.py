@@ -1,47 +1,200 @@
 import os
 import math
+import bisect
+import codecs
+import functools
+import hashlib
+import itertools
+import mmap
+import re
+import asyncio
 import click
+import numpy as np
 import tiktoken
-import requests
-import json
+import httpx
+import orjson
+import shutil
 import subprocess
+from dataclasses import dataclass
 from typing import Optional, List, Dict
 from pathlib import Path
 
+# cl100k never merges a newline with following non-whitespace into one token,
+# so text cut at these points encodes to the same tokens piecewise
+_SEGMENT_BREAK = re.compile(rb'\n(?=[^\s\x80-\xff])')
+_SCAN_BLOCK_SIZE = 1 << 20  # Bytes per read when scanning a mapped file
+_TOKENIZE_SEGMENT_SIZE = 1 << 20  # Bytes of input per tokenizer segment
+_BYTES_PER_TOKEN = 4  # Rough cl100k ratio for English text, used by --quick
+
+def _newline_index(data) -> np.ndarray:
+    """Byte offsets of every newline in data, found a block at a time"""
+    # The view is dropped on return, so the caller's mmap can still be closed
+    view = np.frombuffer(data, dtype=np.uint8)
+    return np.concatenate([
+        np.flatnonzero(view[i:i + _SCAN_BLOCK_SIZE] == 10) + i
+        for i in range(0, len(view), _SCAN_BLOCK_SIZE)
+    ] or [np.empty(0, dtype=np.intp)])
+
+def _check_utf8(data) -> None:
+    """Raise UnicodeDecodeError unless data is valid UTF-8, decoding a block at a time"""
+    decoder = codecs.getincrementaldecoder('utf-8')()
+    # Blocks are copied out so a raised error holds no export of a caller's mmap
+    for i in range(0, len(data), _SCAN_BLOCK_SIZE):
+        decoder.decode(data[i:i + _SCAN_BLOCK_SIZE])
+    decoder.decode(b'', final=True)
+
+def _split_points(data, newlines: np.ndarray) -> np.ndarray:
+    """Preferred split points: just after a sentence-ending '.\n' or a blank line"""
+    # Both are a newline whose previous byte is '.' or another newline
+    view = np.frombuffer(data, dtype=np.uint8)
+    newlines = newlines[newlines > 0]
+    previous = view[newlines - 1]
+    return newlines[(previous == ord('.')) | (previous == ord('\n'))] + 1
+
+def _chunk_offsets(content, num_chunks: int, newlines: np.ndarray) -> List[int]:
+    """Split content into spans of at most len/num_chunks bytes, returning their start offsets plus its end"""
+    size = len(content)
+    chunk_size = math.ceil(size / num_chunks)
+    # A plain list, since each step below is a single scalar lookup
+    boundaries = _split_points(content, newlines).tolist()
+
+    offsets = [0]
+    while offsets[-1] < size:
+        start = offsets[-1]
+        end = start + chunk_size
+        if end >= size:
+            end = size
+        else:
+            # Snap back to the last split point inside this chunk, so no chunk
+            # outgrows chunk_size; snapping adds chunks rather than dropping the tail
+            idx = bisect.bisect_right(boundaries, end) - 1
+            if idx >= 0 and boundaries[idx] > start:
+                end = boundaries[idx]
+            else:
+                # Split points are ASCII; a raw cut must not split a UTF-8 character
+                while end > start and content[end] & 0xC0 == 0x80:
+                    end -= 1
+                if end == start:
+                    # A single character longer than chunk_size gets a chunk to itself
+                    end += 1
+                    while end < size and content[end] & 0xC0 == 0x80:
+                        end += 1
+        offsets.append(end)
+    return offsets
+
+@functools.lru_cache(maxsize=None)
+def _get_encoder(name: str) -> tiktoken.Encoding:
+    """Load a tiktoken encoding once per process and share it"""
+    return tiktoken.get_encoding(name)
+
+# Base limits (theoretical maximums)
+_CONTEXT_LIMITS = {
+    "claude-3-sonnet-20240229": 200000,  # Full 200k
+    "gpt-4": 8192,                       # Full 8k
+    "gpt-3.5-turbo": 4096,              # Full 4k
+}
+
+@functools.lru_cache(maxsize=None)
+def _token_byte_lengths(name: str) -> np.ndarray:
+    """Byte length of every token id in an encoding, for vectorized lookups"""
+    encoder = _get_encoder(name)
+    lengths = np.zeros(encoder.n_vocab, dtype=np.uint16)
+    for token in range(encoder.n_vocab):
+        try:
+            lengths[token] = len(encoder.decode_single_token_bytes(token))
+        except KeyError:
+            pass  # Unused id in the vocabulary
+    return lengths
+
+@dataclass(frozen=True, slots=True)
+class _ChunkConfig:
+    """Settings resolved once per (model, safety factor) and shared by processors"""
+    model: str
+    safety_factor: float
+    effective_limit: int
+    encoding: str
+
+@functools.lru_cache(maxsize=None)
+def _make_config(model: str, safety_factor: Optional[float]) -> _ChunkConfig:
+    """Resolve a processor config; CHUNK_SAFETY_FACTOR is read on the first miss only"""
+    # Use provided safety factor, env var, or default
+    safety_factor = (
+        safety_factor or
+        float(os.getenv('CHUNK_SAFETY_FACTOR', ChunkProcessor.DEFAULT_SAFETY_FACTOR))
+    )
+    return _ChunkConfig(
+        model=model,
+        safety_factor=safety_factor,
+        effective_limit=int(_CONTEXT_LIMITS[model] * safety_factor),
+        encoding="cl100k_base",
+    )
+
 class ChunkProcessor:
     DEFAULT_SAFETY_FACTOR = 0.5  # Class constant for default safety level
+    context_limits = _CONTEXT_LIMITS
     
     def __init__(self, model="claude-3-sonnet-20240229", safety_factor=None):
-        self.model = model
-        # Base limits (theoretical maximums)
-        self.context_limits = {
-            "claude-3-sonnet-20240229": 200000,  # Full 200k
-            "gpt-4": 8192,                       # Full 8k
-            "gpt-3.5-turbo": 4096,              # Full 4k
-        }
-        # Use provided safety factor, env var, or default
-        self.safety_factor = (
-            safety_factor or 
-            float(os.getenv('CHUNK_SAFETY_FACTOR', self.DEFAULT_SAFETY_FACTOR))
-        )
-        self.tokenizer = tiktoken.get_encoding("cl100k_base")
+        self._config = _make_config(model, safety_factor)
+
+    @property
+    def model(self) -> str:
+        return self._config.model
+
+    @property
+    def safety_factor(self) -> float:
+        return self._config.safety_factor
+
+    @property
+    def tokenizer(self) -> tiktoken.Encoding:
+        # Loaded on first use, so --quick runs never load the vocabulary
+        return _get_encoder(self._config.encoding)
 
     def get_effective_limit(self):
         """Get the effective token limit applying safety factor"""
-        base_limit = self.context_limits[self.model]
-        return int(base_limit * self.safety_factor)
+        return self._config.effective_limit
 
     def estimate_tokens(self, text: str) -> int:
         """Estimate token count for text"""
         return len(self.tokenizer.encode(text))
 
-    def process_file(self, input_file: Path, num_chunks: Optional[int] = None, interactive: bool = False):
+    def token_end_offsets(self, data) -> np.ndarray:
+        """Tokenize UTF-8 data once, returning the byte offset where each token ends"""
+        num_threads = os.cpu_count() or 1
+        token_lengths = _token_byte_lengths(self._config.encoding)
+        lengths = []
+        start = 0
+        while start < len(data):
+            # Decode only one segment per thread at a time, so the text and its
+            # token ids are dropped as soon as their token lengths are known
+            segments = []
+            while start < len(data) and len(segments) < num_threads:
+                match = _SEGMENT_BREAK.search(data, start + _TOKENIZE_SEGMENT_SIZE)
+                end = match.end() if match else len(data)
+                segments.append(data[start:end].decode('utf-8'))
+                start = end
+
+            # Segments are encoded on separate threads by tiktoken's Rust core
+            token_lists = self.tokenizer.encode_ordinary_batch(segments, num_threads=num_threads)
+            del segments
+            for token_ids in token_lists:
+                lengths.append(token_lengths[np.array(token_ids, dtype=np.int64)])
+            del token_lists
+
+        if not lengths:
+            return np.empty(0, dtype=np.int64)
+        return np.cumsum(np.concatenate(lengths), dtype=np.int64)
+
+    def process_file(self, input_file: Path, num_chunks: Optional[int] = None,
+                     interactive: bool = False, quick: bool = False):
         """Process input file into chunks with line count validation"""
         try:
-            with open(input_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-                # Count original lines
-                original_lines = content.count('\n')
+            with open(input_file, 'rb') as f:
+                # mmap refuses to map an empty file
+                if os.fstat(f.fileno()).st_size == 0:
+                    click.echo(f"Error: File {input_file} is empty", err=True)
+                    return
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                    chunks_info = self.split_content(input_file, content, num_chunks, quick)
         except FileNotFoundError:
             click.echo(f"Error: File {input_file} not found", err=True)
             return
@@ -49,75 +202,88 @@ class ChunkProcessor:
             click.echo(f"Error: File {input_file} is not valid UTF-8", err=True)
             return
 
-        # Get token stats
-        total_tokens = self.estimate_tokens(content)
+        if interactive:
+            self.process_interactively(chunks_info)
+
+        return chunks_info
+
+    def split_content(self, input_file: Path, content, num_chunks: Optional[int] = None,
+                      quick: bool = False) -> List[dict]:
+        """Write chunk files from a bytes-like view of the input, returning their stats"""
+        # Index newlines once; line counts for any span are then two lookups
+        newlines = _newline_index(content)
+        original_lines = len(newlines)
+
+        if quick:
+            # Approximate tokens from byte counts and skip tokenizing entirely;
+            # the tokenizer's decode is then the only UTF-8 check, so do it here
+            _check_utf8(content)
+            token_ends = None
+            total_tokens = math.ceil(len(content) / _BYTES_PER_TOKEN)
+            approx = "~"
+        else:
+            # Get token stats from a single pass; per-chunk counts are looked up below
+            token_ends = self.token_end_offsets(content)
+            total_tokens = len(token_ends)
+            approx = ""
         effective_limit = self.get_effective_limit()
         
         click.echo(f"\nFile Statistics:")
         click.echo(f"File: {input_file}")
-        click.echo(f"Total characters: {len(content):,}")
+        click.echo(f"Total bytes: {len(content):,}")
         click.echo(f"Total lines: {original_lines:,}")
-        click.echo(f"Estimated tokens: {total_tokens:,}")
+        click.echo(f"Estimated tokens: {approx}{total_tokens:,}")
         click.echo(f"Effective token limit: {effective_limit:,}")
 
         # Calculate chunks needed
         min_chunks = math.ceil(total_tokens / effective_limit)
         if num_chunks is None or num_chunks < min_chunks:
             num_chunks = min_chunks
+        # More chunks than bytes would only produce empty ones
+        num_chunks = min(num_chunks, len(content))
+        offsets = _chunk_offsets(content, num_chunks, newlines)
         
-        click.echo(f"\nSplitting into {num_chunks} chunks...")
+        click.echo(f"\nSplitting into {len(offsets) - 1} chunks...")
 
         # Create chunks directory
         chunks_dir = Path('chunks')
         chunks_dir.mkdir(exist_ok=True)
         
-        # Calculate chunk size
-        chunk_size = math.ceil(len(content) / num_chunks)
-        
         chunks_info = []
-        current_pos = 0
         total_chunk_lines = 0
+        line_counts = np.diff(np.searchsorted(newlines, offsets)).tolist()
+        if token_ends is not None:
+            # Tokens ending inside each chunk's byte span
+            token_counts = np.diff(np.searchsorted(token_ends, offsets, side='right')).tolist()
 
-        for i in range(num_chunks):
-            if current_pos >= len(content):
-                break
-
-            # Get chunk with smart splitting
-            end_pos = min(current_pos + chunk_size, len(content))
-            chunk = content[current_pos:end_pos]
-            
-            if i < num_chunks - 1 and end_pos < len(content):
-                last_period = chunk.rfind('.\n')
-                last_newline = chunk.rfind('\n\n')
-                split_point = max(last_period, last_newline)
-                
-                if split_point != -1:
-                    end_pos = current_pos + split_point + 2
-                    chunk = content[current_pos:end_pos]
-            
-            # Write chunk and count lines
+        for i, (current_pos, end_pos) in enumerate(itertools.pairwise(offsets)):
+            # Write chunk straight from the input buffer
             chunk_file = chunks_dir / f'chunk_{i+1}.txt'
-            chunk_file.write_text(chunk)
-            chunk_lines = chunk.count('\n')
+            chunk_bytes = end_pos - current_pos
+            with memoryview(content)[current_pos:end_pos] as chunk, \
+                    open(chunk_file, 'wb') as f:
+                f.write(chunk)
+            chunk_lines = line_counts[i]
             total_chunk_lines += chunk_lines
             
-            tokens = self.estimate_tokens(chunk)
+            if token_ends is None:
+                tokens = math.ceil(chunk_bytes / _BYTES_PER_TOKEN)
+            else:
+                tokens = token_counts[i]
             chunks_info.append({
                 'file': chunk_file,
-                'chars': len(chunk),
+                'bytes': chunk_bytes,
                 'tokens': tokens,
-                'lines': chunk_lines,
-                'content': chunk
+                'approx': quick,
+                'lines': chunk_lines
             })
             
             click.echo(f"\nChunk {i+1}:")
             click.echo(f"- File: {chunk_file}")
             click.echo(f"- Lines: {chunk_lines:,}")
-            click.echo(f"- Characters: {len(chunk):,}")
-            click.echo(f"- Tokens: {tokens:,}")
-            click.echo(f"- Token limit: {tokens:,}/{effective_limit:,}")
-            
-            current_pos = end_pos
+            click.echo(f"- Bytes: {chunk_bytes:,}")
+            click.echo(f"- Tokens: {approx}{tokens:,}")
+            click.echo(f"- Token limit: {approx}{tokens:,}/{effective_limit:,}")
 
         # Validate total lines
         click.echo("\nLine count validation:")
@@ -126,9 +292,6 @@ class ChunkProcessor:
         if original_lines != total_chunk_lines:
             click.echo(f"Warning: Lost {original_lines - total_chunk_lines} lines during chunking!", err=True)
 
-        if interactive:
-            self.process_interactively(chunks_info)
-
         return chunks_info
 
     def process_interactively(self, chunks_info: List[dict]):
@@ -136,12 +299,15 @@ class ChunkProcessor:
         for i, chunk_info in enumerate(chunks_info, 1):
             click.echo(f"\nProcessing Chunk {i}/{len(chunks_info)}")
             click.echo(f"Lines: {chunk_info['lines']:,}")
-            click.echo(f"Tokens: {chunk_info['tokens']:,}")
+            approx = "~" if chunk_info['approx'] else ""
+            click.echo(f"Tokens: {approx}{chunk_info['tokens']:,}")
             
             try:
-                process = subprocess.Popen(['pbcopy'], stdin=subprocess.PIPE)
-                process.communicate(chunk_info['content'].encode())
-            except subprocess.SubprocessError:
+                # Stream the chunk file to pbcopy rather than reading it into memory
+                with open(chunk_info['file'], 'rb') as f, \
+                        subprocess.Popen(['pbcopy'], stdin=subprocess.PIPE) as process:
+                    shutil.copyfileobj(f, process.stdin, length=_SCAN_BLOCK_SIZE)
+            except (subprocess.SubprocessError, OSError):
                 click.echo("Error: Failed to copy to clipboard", err=True)
                 if not click.confirm("Continue anyway?"):
                     return
@@ -155,49 +321,88 @@ class ChunkProcessor:
 class LittleLisperConverter:
     OLLAMA_URL = "http://localhost:11434/api/generate"
     MODEL = "llama3.2:latest"
+    DEFAULT_NUM_PARALLEL = 4  # Concurrent requests unless OLLAMA_NUM_PARALLEL is set
+    # Static prompt text placed around each chunk
+    PROMPT_PREFIX = """In org-mode with Babel and Tangle (use :mkdirp t to ensure examples don't pollute) make A Little Schemer version of the attached:
+
+"""
+    PROMPT_SUFFIX = """
+
+The response should be valid org-mode with:
+1. Question and Answer format
+2. Code blocks using #+begin_src lisp and proper tangling
+3. Clear progressive learning style
+4. Each concept building on previous ones
+"""
+    
+    CACHE_DIR = Path('.llc_cache')  # Org output of previously converted chunks
     
     def __init__(self):
         self.chunks: List[Dict] = []
         self.org_sections: List[str] = []
+        # Requests kept in flight at once; match the server's OLLAMA_NUM_PARALLEL
+        num_parallel = os.getenv('OLLAMA_NUM_PARALLEL', str(self.DEFAULT_NUM_PARALLEL))
+        try:
+            self.parallelism = max(1, int(num_parallel))
+        except ValueError:
+            click.echo(f"Warning: Ignoring invalid OLLAMA_NUM_PARALLEL={num_parallel!r}, "
+                       f"using {self.DEFAULT_NUM_PARALLEL}", err=True)
+            self.parallelism = self.DEFAULT_NUM_PARALLEL
+        # Cache keys depend on the model and prompt, so changing either misses
+        self._cache_salt = hashlib.blake2b(
+            "\0".join((self.MODEL, self.PROMPT_PREFIX, self.PROMPT_SUFFIX)).encode(),
+            digest_size=16
+        ).digest()
+
+    def cache_path(self, chunk: bytes) -> Path:
+        """Cache file holding the org output for a chunk's raw bytes"""
+        digest = hashlib.blake2b(chunk, digest_size=16, key=self._cache_salt)
+        return self.CACHE_DIR / digest.hexdigest()
+
+    async def convert_chunk_cached(self, chunk: bytes, client: httpx.AsyncClient) -> str:
+        """Convert a chunk, reusing the org output from an earlier run when cached"""
+        cache_file = self.cache_path(chunk)
+        if cache_file.exists():
+            return cache_file.read_text(encoding='utf-8')
+        
+        org_content = await self.convert_chunk_async(chunk.decode('utf-8'), client)
+        if org_content:
+            # Write then rename so an interrupted run never leaves a partial entry
+            self.CACHE_DIR.mkdir(exist_ok=True)
+            tmp_file = cache_file.with_suffix('.tmp')
+            tmp_file.write_text(org_content, encoding='utf-8')
+            tmp_file.replace(cache_file)
+        return org_content
 
     def check_ollama(self) -> bool:
         """Verify Ollama is running and model is available"""
         try:
-            response = requests.get("http://localhost:11434/api/tags")
+            response = httpx.get("http://localhost:11434/api/tags")
             if response.status_code == 200:
                 models = response.json().get("models", [])
                 return any(m["name"] == self.MODEL for m in models)
             return False
-        except requests.RequestException:
+        except httpx.HTTPError:
             return False
 
-    def convert_chunk(self, chunk: str) -> str:
+    async def convert_chunk_async(self, chunk: str, client: httpx.AsyncClient) -> str:
         """Convert a chunk of text to Little Schemer style org-mode"""
-        prompt = f"""In org-mode with Babel and Tangle (use :mkdirp t to ensure examples don't pollute) make A Little Schemer version of the attached:
-
-{chunk}
-
-The response should be valid org-mode with:
-1. Question and Answer format
-2. Code blocks using #+begin_src lisp and proper tangling
-3. Clear progressive learning style
-4. Each concept building on previous ones
-"""
+        prompt = self.PROMPT_PREFIX + chunk + self.PROMPT_SUFFIX
         
         response_text = ""
         try:
-            response = requests.post(
+            async with client.stream(
+                "POST",
                 self.OLLAMA_URL,
                 json={"model": self.MODEL, "prompt": prompt},
-                stream=True
-            )
-            
-            for line in response.iter_lines():
-                if line:
-                    data = json.loads(line)
-                    response_text += data.get("response", "")
+                timeout=None
+            ) as response:
+                async for line in response.aiter_lines():
+                    if line:
+                        data = orjson.loads(line)
+                        response_text += data.get("response", "")
                     
-        except requests.RequestException as e:
+        except httpx.HTTPError as e:
             click.echo(f"Error calling Ollama: {e}", err=True)
             return ""
             
@@ -211,12 +416,12 @@ The response should be valid org-mode with:
 #+PROPERTY: header-args:lisp :mkdirp t :tangle yes
 
 """
-        with open(output_file, "w") as f:
-            f.write(header)
-            for i, section in enumerate(self.org_sections, 1):
-                f.write(f"\n* Chapter {i}\n")
-                f.write(section)
-                f.write("\n")
+        parts = [header.encode()]
+        for i, section in enumerate(self.org_sections, 1):
+            parts += [f"\n* Chapter {i}\n".encode(), section.encode(), b"\n"]
+        # One large buffer turns the per-section writes into a few syscalls
+        with open(output_file, "wb", buffering=1 << 20) as f:
+            f.writelines(parts)
 
 def convert_to_little_lisper(chunks_info: List[dict]) -> str:
     """Convert chunks to Little Lisper style and combine"""
@@ -226,11 +431,31 @@ def convert_to_little_lisper(chunks_info: List[dict]) -> str:
         click.echo("Error: Ollama not running or llama2 model not available", err=True)
         return None
         
-    with click.progressbar(chunks_info, 
-                          label='Converting to Little Lisper style') as chunks:
-        for chunk in chunks:
-            org_content = converter.convert_chunk(chunk['content'])
-            converter.org_sections.append(org_content)
+    num_parallel = converter.parallelism
+    if num_parallel == 1:
+        click.echo("Note: OLLAMA_NUM_PARALLEL=1 converts one chunk at a time. "
+                   "Run `export OLLAMA_NUM_PARALLEL=8` before `ollama serve` "
+                   "and this command to convert chunks concurrently.", err=True)
+    
+    with click.progressbar(length=len(chunks_info),
+                          label='Converting to Little Lisper style') as bar:
+        async def _run():
+            # Bound in-flight requests; gather keeps results in chunk order
+            semaphore = asyncio.Semaphore(num_parallel)
+            # Pool sized to the semaphore so every in-flight request keeps its connection
+            limits = httpx.Limits(max_connections=num_parallel,
+                                  max_keepalive_connections=num_parallel)
+            async with httpx.AsyncClient(limits=limits) as client:
+                async def _convert(chunk):
+                    async with semaphore:
+                        # Chunk text is read back lazily rather than held in chunks_info
+                        data = chunk['file'].read_bytes()
+                        org_content = await converter.convert_chunk_cached(data, client)
+                    bar.update(1)
+                    return org_content
+                return await asyncio.gather(*(_convert(chunk) for chunk in chunks_info))
+        
+        converter.org_sections.extend(asyncio.run(_run()))
     
     converter.stitch_org_file()
     click.echo(f"\nCreated little-lisper-paip.org")
@@ -244,10 +469,12 @@ def convert_to_little_lisper(chunks_info: List[dict]) -> str:
               help='Model to use for token limits')
 @click.option('-s', '--safety-factor', type=float,
               help=f'Factor to multiply context window by (default: {ChunkProcessor.DEFAULT_SAFETY_FACTOR})')
+@click.option('--quick', is_flag=True,
+              help='Estimate tokens as bytes/4 instead of running the tokenizer')
 @click.option('--little-lisper', is_flag=True, 
               help='Convert chunks to Little Schemer style org-mode')
 def main(filename: str, num_chunks: Optional[int], interactive: bool, 
-         model: str, safety_factor: float, little_lisper: bool):
+         model: str, safety_factor: float, quick: bool, little_lisper: bool):
     """Split a text file into chunks suitable for LLM processing.
     
     If FILENAME is not specified, defaults to PAIP.txt
@@ -255,6 +482,16 @@ def main(filename: str, num_chunks: Optional[int], interactive: bool,
     The safety factor determines what portion of the model's maximum context
     window to use. Default is 0.5 (50%). Can be overridden with -s option
     or CHUNK_SAFETY_FACTOR environment variable.
+    
+    Set TIKTOKEN_CACHE_DIR to keep the downloaded tokenizer vocabulary on
+    disk between runs. With --quick, token counts are estimated from byte
+    counts and the tokenizer is never loaded.
+    
+    With --little-lisper, chunks are sent to Ollama concurrently, at most
+    OLLAMA_NUM_PARALLEL (default: 4) at a time. Start `ollama serve` with
+    the same OLLAMA_NUM_PARALLEL so the server decodes them in parallel.
+    Converted chunks are cached in .llc_cache/ and reused on later runs
+    until the chunk text, model, or prompt changes.
     """
     processor = ChunkProcessor(model=model, safety_factor=safety_factor)
     
@@ -267,7 +504,8 @@ def main(filename: str, num_chunks: Optional[int], interactive: bool,
     chunks_info = processor.process_file(
         Path(filename),
         num_chunks=num_chunks,
-        interactive=interactive
+        interactive=interactive,
+        quick=quick
     )
     
     if little_lisper and chunks_info: